@@ -0,0 +1,193 @@
+"""Route-level benchmarks: latency percentiles, SQL query count and peak Python
+memory for the main pages, run in-process through Flask's test client against
+the database at DATABASE_URL (seed it first with benchmarks/seed.py).
+
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmarks/run.py
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmarks/run.py --save baseline.json
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmarks/run.py --compare baseline.json
+
+With --compare the run exits with status 1 when a route's p95 latency grew by
+more than --threshold (default 1.25x) or it started issuing more queries.
+Note that some routes write: `order POST` places real orders.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+os.environ.setdefault('EMAIL_WORKERS', '0')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image   # noqa: E402
+from sqlalchemy import event   # noqa: E402
+
+from app import app, db, Design, Order, image_id_from_url   # noqa: E402
+
+
+class QueryCounter:
+    """Counts statements sent to the database while `active`."""
+
+    def __init__(self, engine):
+        self.count  = 0
+        self.active = False
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        if self.active:
+            self.count += 1
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def payment_png():
+    buf = BytesIO()
+    Image.new('RGB', (64, 64), (30, 120, 200)).save(buf, 'PNG')
+    return buf.getvalue()
+
+
+def build_cases(fixtures):
+    """(name, method, path, request kwargs factory) for every benchmarked route."""
+    png = payment_png()
+
+    def order_form():
+        return {'data': {
+            'customer_name': 'Bench', 'house': '1-1', 'city': 'Hyderabad', 'mandal': 'Central',
+            'pincode': '500001', 'email': '', 'size': 'M', 'quantity': '1',
+            'phone': f"8{time.perf_counter_ns() % 10 ** 9:09d}",
+            'payment': (BytesIO(png), 'payment.png'),
+        }, 'content_type': 'multipart/form-data'}
+
+    code, phone, image = fixtures['design_code'], fixtures['phone'], fixtures['image_id']
+    return [
+        ('home',                'GET',  '/',                              None),
+        ('track_order',         'POST', '/track',                         lambda: {'data': {'phone': phone}}),
+        ('order GET',           'GET',  f'/order/{code}',                 None),
+        ('order POST',          'POST', f'/order/{code}',                 order_form),
+        ('dashboard',           'GET',  '/dashboard',                     None),
+        ('dashboard json',      'GET',  '/dashboard?format=json',         None),
+        ('export_orders xlsx',  'GET',  '/export_orders',                 None),
+        ('export_orders csv',   'GET',  '/export_orders?format=csv',      None),
+        ('sales_analysis',      'GET',  '/sales_analysis',                None),
+        ('img original',        'GET',  f'/img/{image}',                  None),
+        ('img w=320',           'GET',  f'/img/{image}?w=320',            None),
+    ]
+
+
+def load_fixtures():
+    with app.app_context():
+        design = Design.query.filter(Design.image.isnot(None), Design.stock == 'In Stock')\
+                             .order_by(Design.id).first()
+        phone  = db.session.query(Order.phone).order_by(Order.id).limit(1).scalar()
+        orders = db.session.query(db.func.count(Order.id)).scalar()
+    if not design or not phone:
+        sys.exit("No designs / orders found — run benchmarks/seed.py first.")
+    return {'design_code': design.design_code, 'phone': phone,
+            'image_id': image_id_from_url(design.image), 'orders': orders}
+
+
+def send(client, counter, method, path, make_kwargs):
+    """One request, body fully drained; returns (elapsed seconds, query count)."""
+    kwargs = make_kwargs() if make_kwargs else {}
+    counter.count, counter.active = 0, True
+    started = time.perf_counter()
+    resp = client.open(path, method=method, **kwargs)
+    resp.get_data()   # drain streamed bodies (exports, images)
+    elapsed = time.perf_counter() - started
+    counter.active = False
+    resp.close()
+    if resp.status_code >= 400:
+        raise RuntimeError(f"{method} {path} returned {resp.status_code}")
+    return elapsed, counter.count
+
+
+def run_case(client, counter, method, path, make_kwargs, requests, warmup):
+    for _ in range(warmup):
+        send(client, counter, method, path, make_kwargs)
+    timings, queries = [], []
+    for _ in range(requests):
+        elapsed, count = send(client, counter, method, path, make_kwargs)
+        timings.append(elapsed * 1000)
+        queries.append(count)
+    # Peak memory comes from one extra request: tracing slows everything
+    # down too much to leave it on while timing.
+    tracemalloc.start()
+    send(client, counter, method, path, make_kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    timings.sort()
+    return {
+        'p50_ms':      round(percentile(timings, 50), 2),
+        'p95_ms':      round(percentile(timings, 95), 2),
+        'p99_ms':      round(percentile(timings, 99), 2),
+        'max_ms':      round(timings[-1], 2),
+        'queries':     max(queries),
+        'peak_mem_kb': peak // 1024,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Names of routes that regressed against a saved run."""
+    regressed = []
+    for name, now in results.items():
+        before = baseline.get('routes', {}).get(name)
+        if not before:
+            continue
+        if now['p95_ms'] > before['p95_ms'] * threshold or now['queries'] > before['queries']:
+            regressed.append(name)
+            print(f"REGRESSION {name}: p95 {before['p95_ms']} → {now['p95_ms']} ms, "
+                  f"queries {before['queries']} → {now['queries']}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the main routes.')
+    parser.add_argument('--requests',  type=int, default=30, help='Measured requests per route.')
+    parser.add_argument('--warmup',    type=int, default=3)
+    parser.add_argument('--only',      action='append', help='Route name to run (repeatable).')
+    parser.add_argument('--save',      help='Write results as JSON to this file.')
+    parser.add_argument('--compare',   help='JSON file from an earlier --save run.')
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args()
+
+    app.config['WTF_CSRF_ENABLED'] = False
+    fixtures = load_fixtures()
+    client   = app.test_client()
+    with client.session_transaction() as s:
+        s['admin'] = True
+    with app.app_context():
+        counter = QueryCounter(db.engine)
+        backend = db.engine.url.get_backend_name()
+
+    print(f"database={backend} orders={fixtures['orders']} "
+          f"requests={args.requests}")
+    print(f"{'route':<22}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+          f"{'queries':>9}{'peak KB':>10}")
+    results = {}
+    for name, method, path, make_kwargs in build_cases(fixtures):
+        if args.only and name not in args.only:
+            continue
+        r = results[name] = run_case(client, counter, method, path, make_kwargs,
+                                     args.requests, args.warmup)
+        print(f"{name:<22}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['max_ms']:>9}"
+              f"{r['queries']:>9}{r['peak_mem_kb']:>10}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'orders': fixtures['orders'], 'routes': results}, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(results, json.load(f), args.threshold):
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""Synthetic data generator for the route benchmarks (benchmarks/run.py).
+
+Fills the database at DATABASE_URL with designs (each with generated JPEG
+images), orders spread over the last two years and payment screenshots.
+Point it at SQLite or a local Postgres — never at the production database.
+
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmarks/seed.py --orders 100000 --reset
+    DATABASE_URL=postgresql://localhost/threadline_bench python benchmarks/seed.py \\
+        --orders 1000000 --designs 500 --images-per-design 3 --reset
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from io import BytesIO
+
+os.environ.setdefault('EMAIL_WORKERS', '0')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image   # noqa: E402
+
+from app import (app, db, Design, DesignImage, EmailOutbox, ImageDerivative, Order,   # noqa: E402
+                 StockReservation, StoredImage, TIMESTAMP_FORMAT, init_db,
+                 invalidate_catalog, invalidate_dashboard_kpis)
+
+BATCH    = 5000
+STATUSES = (['Completed'] * 12 + ['Cancelled'] * 2 +
+            ['Pending', 'Verifying', 'Processing', 'Shipped'])
+SIZES    = ['S', 'M', 'L', 'XL', 'XXL']
+CITIES   = ['Hyderabad', 'Warangal', 'Vijayawada', 'Guntur', 'Nellore', 'Karimnagar',
+            'Tirupati', 'Kurnool', 'Nizamabad', 'Khammam']
+NAMES    = ['Arjun', 'Divya', 'Kiran', 'Lakshmi', 'Mahesh', 'Priya', 'Ravi', 'Sita',
+            'Teja', 'Vamsi']
+
+
+def make_jpeg(rng, size):
+    """A small gradient JPEG with random colours, so every image is distinct."""
+    a = tuple(rng.randrange(256) for _ in range(3))
+    b = tuple(rng.randrange(256) for _ in range(3))
+    img = Image.new('RGB', size, a)
+    img.paste(Image.new('RGB', (size[0], size[1] // 2), b), (0, size[1] // 2))
+    buf = BytesIO()
+    img.save(buf, 'JPEG', quality=85)
+    return buf.getvalue()
+
+
+def add_image(data):
+    img = StoredImage(data=data, mime_type='image/jpeg',
+                      sha256=hashlib.sha256(data).hexdigest(), ref_count=1)
+    db.session.add(img)
+    db.session.flush()
+    return f'/img/{img.id}'
+
+
+def reset():
+    for model in (StockReservation, EmailOutbox, Order, DesignImage, ImageDerivative,
+                  Design, StoredImage):
+        model.query.delete()
+    db.session.commit()
+
+
+def seed_designs(rng, count, images_per_design, image_size):
+    codes = []
+    for i in range(count):
+        code  = f'B{i:04d}'
+        price = rng.choice([299, 399, 499, 599, 799, 999])
+        urls  = [add_image(make_jpeg(rng, image_size)) for _ in range(images_per_design)]
+        d = Design(design_code=code, name=f'Bench Design {i}',
+                   description='Synthetic benchmark design', price=str(price),
+                   price_amount=price, image=urls[0] if urls else None,
+                   stock='In Stock', stock_quantity=10 ** 6)
+        d.images = [DesignImage(filename=u, sort_order=n) for n, u in enumerate(urls)]
+        db.session.add(d)
+        codes.append((code, d.name))
+        if i % 50 == 49:
+            db.session.commit()
+    db.session.commit()
+    return codes
+
+
+def seed_orders(rng, count, designs, phones, screenshots):
+    now    = datetime.now().replace(second=0, microsecond=0)
+    span   = 2 * 365 * 24 * 60   # minutes
+    for start in range(0, count, BATCH):
+        rows = []
+        for _ in range(start, min(start + BATCH, count)):
+            code, name = rng.choice(designs)
+            status     = rng.choice(STATUSES)
+            created    = now - timedelta(minutes=rng.randrange(span))
+            later      = created + timedelta(days=rng.randint(1, 7))
+            qty        = rng.randint(1, 3)
+            row = {
+                'design': name, 'design_code': code,
+                'customer_name': rng.choice(NAMES), 'house': f'{rng.randint(1, 999)}-{rng.randint(1, 99)}',
+                'city': rng.choice(CITIES), 'mandal': 'Central', 'pincode': f'5{rng.randint(0, 99999):05d}',
+                'email': '', 'size': rng.choice(SIZES), 'quantity': str(qty), 'qty': qty,
+                'phone': f'9{rng.randrange(phones):09d}',
+                'payment_image': rng.choice(screenshots), 'status': status,
+                'created_at': created.strftime(TIMESTAMP_FORMAT), 'created_ts': created,
+                'completed_at': None, 'completed_ts': None,
+                'cancelled_at': None, 'cancelled_ts': None,
+                'status_updated_at': None, 'status_updated_ts': None,
+            }
+            if status == 'Completed':
+                row.update(completed_at=later.strftime(TIMESTAMP_FORMAT), completed_ts=later)
+            elif status == 'Cancelled':
+                row.update(cancelled_at=later.strftime(TIMESTAMP_FORMAT), cancelled_ts=later)
+            elif status != 'Pending':
+                row.update(status_updated_at=later.strftime(TIMESTAMP_FORMAT), status_updated_ts=later)
+            rows.append(row)
+        db.session.execute(db.insert(Order), rows)
+        db.session.commit()
+        print(f"[SEED] orders {start + len(rows)}/{count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed a benchmark database.')
+    parser.add_argument('--orders',            type=int, default=1000)
+    parser.add_argument('--designs',           type=int, default=100)
+    parser.add_argument('--images-per-design', type=int, default=2)
+    parser.add_argument('--image-size',        type=int, default=800,
+                        help='Edge length in pixels of generated design images.')
+    parser.add_argument('--screenshots',       type=int, default=50,
+                        help='Distinct payment screenshots shared by the orders.')
+    parser.add_argument('--phones',            type=int, default=None,
+                        help='Distinct customer phone numbers (default: orders / 3).')
+    parser.add_argument('--seed',              type=int, default=1)
+    parser.add_argument('--reset', action='store_true',
+                        help='Delete existing orders, designs and images first.')
+    args = parser.parse_args()
+
+    rng     = random.Random(args.seed)
+    started = time.perf_counter()
+    with app.app_context():
+        init_db()
+        if args.reset:
+            reset()
+        designs     = seed_designs(rng, args.designs, args.images_per_design,
+                                   (args.image_size, args.image_size))
+        screenshots = [add_image(make_jpeg(rng, (360, 720))) for _ in range(args.screenshots)]
+        db.session.commit()
+        print(f"[SEED] {len(designs)} designs, {len(screenshots)} screenshots")
+        seed_orders(rng, args.orders, designs, args.phones or max(1, args.orders // 3), screenshots)
+        invalidate_catalog()
+        invalidate_dashboard_kpis()
+        db.session.commit()
+        if db.engine.dialect.name in ('postgresql', 'sqlite'):
+            with db.engine.connect() as conn:
+                conn.exec_driver_sql('ANALYZE')
+                conn.commit()
+    print(f"[SEED] done in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Worker startup benchmark: how long a fresh process takes to import app.py
+and serve its first request, as every gunicorn worker and Render cold start
+does. Each run is a new interpreter, so nothing is shared between runs. Also
+reports whether the heavy optional libraries were loaded at boot.
+
+    DATABASE_URL=sqlite:////tmp/bench.db python benchmarks/startup.py --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+heavy_at_import = [m for m in ('reportlab', 'openpyxl', 'PIL') if m in sys.modules]
+client = app.app.test_client()
+resp = client.get('/')
+resp.get_data()
+t2 = time.perf_counter()
+heavy = [m for m in ('reportlab', 'openpyxl', 'PIL') if m in sys.modules]
+print(json.dumps({'import_ms': (t1 - t0) * 1000, 'first_request_ms': (t2 - t1) * 1000,
+                  'status': resp.status_code, 'heavy_after_request': heavy,
+                  'heavy_at_import': heavy_at_import}))
+"""
+
+
+def run_once():
+    env = dict(os.environ, EMAIL_WORKERS='0')
+    out = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure cold-start time of app.py.')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    for key in ('import_ms', 'first_request_ms'):
+        values = [r[key] for r in runs]
+        print(f"{key:<18} median {statistics.median(values):8.1f}   "
+              f"min {min(values):8.1f}   max {max(values):8.1f}")
+    print(f"first request status: {runs[-1]['status']}")
+    print(f"heavy modules at import:      {runs[-1]['heavy_at_import'] or 'none'}")
+    print(f"heavy modules after GET /:    {runs[-1]['heavy_after_request'] or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
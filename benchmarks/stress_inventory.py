@@ -0,0 +1,116 @@
+"""Concurrency stress test for the stock reservation path (reserve_stock).
+
+Many threads check out the same design at once until it sells out. The run
+fails (exit status 1) if stock ever goes negative, if a unit is sold twice or
+lost, if the design is not marked out of stock at the end, or if a thread
+hits --max-errors errors in a row (a lost connection, a schema mismatch). Use
+a scratch database — the design it creates is deleted afterwards.
+
+    DATABASE_URL=sqlite:////tmp/stress.db python benchmarks/stress_inventory.py
+    DATABASE_URL=postgresql://... python benchmarks/stress_inventory.py --threads 64 --stock 2000
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, Design, StockReservation, init_db, reserve_stock   # noqa: E402
+
+DESIGN_CODE = 'STRESS-INV'
+
+
+def checkout_loop(order_ids, max_qty, max_errors, results, errors, gave_up):
+    """One simulated shopper after another, until the design is sold out or
+    max_errors checkouts in a row have failed."""
+    taken = []; failed = 0
+    with app.app_context():
+        while failed < max_errors:
+            try:
+                qty = reserve_stock(DESIGN_CODE, random.randint(1, max_qty))
+                if not qty:
+                    db.session.rollback()
+                    break
+                db.session.add(StockReservation(order_id=next(order_ids),
+                                                design_code=DESIGN_CODE, qty=qty))
+                db.session.commit()
+                taken.append(qty); failed = 0
+            except Exception as e:   # a lock timeout etc. — count it and retry
+                db.session.rollback()
+                errors.append(repr(e)); failed += 1
+        else:
+            gave_up.append(threading.current_thread().name)
+        db.session.remove()
+    results.append(taken)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--stock',   type=int, default=1000)
+    parser.add_argument('--max-qty', type=int, default=3)
+    parser.add_argument('--max-errors', type=int, default=20,
+                        help='consecutive failed checkouts after which a thread gives up')
+    args = parser.parse_args()
+
+    with app.app_context():
+        init_db()
+        StockReservation.query.filter_by(design_code=DESIGN_CODE).delete()
+        Design.query.filter_by(design_code=DESIGN_CODE).delete()
+        db.session.add(Design(design_code=DESIGN_CODE, name='Stress test', price='1',
+                              stock='In Stock', stock_quantity=args.stock))
+        db.session.commit()
+        first_id = -(10 ** 9)   # well away from real order ids
+
+    order_ids = itertools.count(first_id)
+    results, errors, gave_up = [], [], []
+    threads = [threading.Thread(target=checkout_loop,
+                                args=(order_ids, args.max_qty, args.max_errors,
+                                      results, errors, gave_up))
+               for _ in range(args.threads)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        d        = Design.query.filter_by(design_code=DESIGN_CODE).one()
+        reserved = db.session.query(db.func.coalesce(db.func.sum(StockReservation.qty), 0))\
+                     .filter_by(design_code=DESIGN_CODE).scalar()
+        final_qty, final_stock = d.stock_quantity, d.stock
+        StockReservation.query.filter_by(design_code=DESIGN_CODE).delete()
+        db.session.delete(d)
+        db.session.commit()
+
+    sold     = sum(sum(t) for t in results)
+    checkouts = sum(len(t) for t in results)
+    print(f"threads={args.threads} stock={args.stock} checkouts={checkouts} units={sold} "
+          f"retried_errors={len(errors)} elapsed={elapsed:.2f}s "
+          f"throughput={checkouts / elapsed:.0f} checkouts/s")
+
+    problems = []
+    if gave_up:
+        problems.append(f"{len(gave_up)} thread(s) gave up after {args.max_errors} errors in a row")
+    if final_qty < 0:
+        problems.append(f"stock went negative ({final_qty})")
+    if sold != reserved:
+        problems.append(f"{sold} units sold but {reserved} recorded in reservations")
+    if sold + final_qty != args.stock:
+        problems.append(f"{sold} sold + {final_qty} left != {args.stock} initial")
+    if final_qty == 0 and final_stock != 'Out of Stock':
+        problems.append(f"sold out but design is marked {final_stock!r}")
+    for p in problems:
+        print(f"FAIL: {p}")
+    if errors:
+        print(f"first error: {errors[0]}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""Invoice PDF rendering, kept free of Flask / database imports so that
+worker processes for bulk invoice generation only import ReportLab."""
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+
+def render_invoice_pdf(fields):
+    """Render one invoice from a dict of display strings (see invoice_fields
+    in app.py) and return the PDF bytes."""
+    buf = BytesIO()
+    c   = canvas.Canvas(buf, pagesize=letter)
+    c.setFont("Helvetica-Bold", 18)
+    c.drawString(180, 760, "THREADLINE — INVOICE")
+    c.setFont("Helvetica", 12)
+    for y, text in [
+        (720, f"Order ID  : #{fields['id']}"),
+        (700, f"Date      : {fields['date']}"),
+        (670, f"Customer  : {fields['customer_name']}"),
+        (650, f"Phone     : {fields['phone']}"),
+        (630, f"Address   : {fields['address']}"),
+        (600, f"Product   : {fields['design']}"),
+        (580, f"Size      : {fields['size']}"),
+        (560, f"Quantity  : {fields['quantity']}"),
+        (540, f"Amount    : Rs.{fields['price']}"),
+        (518,  "Estimated Delivery : 3-5 business days"),
+    ]:
+        c.drawString(50, y, text)
+    c.setFont("Helvetica-Bold", 11)
+    c.drawString(50, 490, "Thank you for shopping with THREADLINE!")
+    c.save()
+    return buf.getvalue()
@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('EMAIL_WORKERS', '0')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as shop   # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    """One app on a scratch SQLite file for the whole run; the process-level
+    caches in app.py assume a single database."""
+    tmp = tempfile.mkdtemp(prefix='threadline-tests-')
+    app = shop.create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'test.db')}",
+        'UPLOAD_SPOOL_DIR':        os.path.join(tmp, 'spool'),
+        'BLOB_DIR':                os.path.join(tmp, 'blobs'),
+        'WTF_CSRF_ENABLED':        False,
+        'TESTING':                 True,
+    })
+    with app.app_context():
+        shop.init_db()
+    return app
+
+
+@pytest.fixture
+def admin(app):
+    client = app.test_client()
+    with client.session_transaction() as s:
+        s['admin'] = True
+    return client
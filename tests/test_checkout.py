@@ -0,0 +1,64 @@
+import os
+from io import BytesIO
+
+from PIL import Image
+
+import app as shop
+
+
+def order_form(phone, colour, quantity='1'):
+    buf = BytesIO()
+    Image.new('RGB', (30, 30), colour).save(buf, 'PNG')
+    return {'customer_name': 'Test', 'house': '1-1', 'city': 'Hyderabad', 'mandal': 'Central',
+            'pincode': '500001', 'email': '', 'size': 'M', 'quantity': quantity,
+            'phone': phone, 'payment': (BytesIO(buf.getvalue()), 'pay.png')}
+
+
+def test_checkout_takes_stock_and_sold_out_leaves_no_upload(app, monkeypatch):
+    monkeypatch.setattr(shop, 'UPLOAD_WORKERS', 0)
+    with app.app_context():
+        shop.db.session.add(shop.Design(design_code='CHK1', name='Checkout test', description='',
+                                        price='100', price_amount=100, stock='In Stock',
+                                        stock_quantity=2))
+        shop.db.session.commit()
+    client = app.test_client()
+
+    resp = client.post('/order/CHK1', data=order_form('9000000001', (10, 20, 30), '5'),
+                       content_type='multipart/form-data')
+    assert resp.status_code == 200 and b'sold out' not in resp.data
+    with app.app_context():
+        design = shop.Design.query.filter_by(design_code='CHK1').one()
+        order  = shop.Order.query.filter_by(phone='9000000001').one()
+        assert (design.stock_quantity, design.stock, order.qty) == (0, 'Out of Stock', 2)
+        assert shop.StockReservation.query.filter_by(order_id=order.id).one().qty == 2
+
+        # Sold out between the page load and the POST: nothing is kept.
+        shop.Design.query.filter_by(design_code='CHK1').update({'stock': 'In Stock'})
+        shop.db.session.commit()
+    spool  = app.config['UPLOAD_SPOOL_DIR']
+    before = set(os.listdir(spool))
+    resp = client.post('/order/CHK1', data=order_form('9000000002', (40, 50, 60)),
+                       content_type='multipart/form-data')
+    assert b'sold out' in resp.data
+    assert set(os.listdir(spool)) == before
+    with app.app_context():
+        assert shop.Order.query.filter_by(phone='9000000002').count() == 0
+
+
+def test_checkout_losing_the_stock_race_rolls_back(app, monkeypatch):
+    monkeypatch.setattr(shop, 'UPLOAD_WORKERS', 0)
+    monkeypatch.setattr(shop, 'reserve_stock', lambda design_code, wanted: 0)
+    with app.app_context():
+        shop.db.session.add(shop.Design(design_code='CHK2', name='Race test', description='',
+                                        price='100', price_amount=100, stock='In Stock',
+                                        stock_quantity=5))
+        shop.db.session.commit()
+    spool  = app.config['UPLOAD_SPOOL_DIR']
+    before = set(os.listdir(spool)) if os.path.isdir(spool) else set()
+    resp = app.test_client().post('/order/CHK2', data=order_form('9000000003', (70, 80, 90)),
+                                  content_type='multipart/form-data')
+    assert b'sold out' in resp.data
+    assert set(os.listdir(spool)) == before
+    with app.app_context():
+        assert shop.Order.query.filter_by(phone='9000000003').count() == 0
+        assert shop.StockReservation.query.filter_by(design_code='CHK2').count() == 0
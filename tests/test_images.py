@@ -0,0 +1,75 @@
+import hashlib
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+import app as shop
+
+
+def stored_png(size=(900, 600)):
+    buf = BytesIO()
+    Image.new('RGB', size, (200, 80, 40)).save(buf, 'PNG')
+    data = buf.getvalue()
+    img  = shop.StoredImage(data=data, mime_type='image/png', ref_count=1,
+                            sha256=hashlib.sha256(data).hexdigest())
+    shop.db.session.add(img)
+    shop.db.session.commit()
+    return img.id
+
+
+def test_repeated_width_request_hits_derivative_cache(app):
+    with app.app_context():
+        source_id = stored_png()
+    client = app.test_client()
+    first  = client.get(f'/img/{source_id}?w=320', headers={'Accept': 'image/webp'})
+    assert first.status_code == 200 and first.mimetype == 'image/webp'
+
+    derived_id = shop.derivative_ids.get((source_id, 320, 'webp'))
+    assert derived_id is not None
+    hits   = shop.derivative_ids.hits
+    second = client.get(f'/img/{source_id}?w=320', headers={'Accept': 'image/webp'})
+    assert second.status_code == 200
+    assert shop.derivative_ids.hits == hits + 1
+    assert second.get_data() == first.get_data()
+    with app.app_context():
+        assert shop.ImageDerivative.query.filter_by(source_id=source_id).count() == 1
+
+
+def test_migrate_blobs_moves_ready_images_only(app):
+    with app.app_context():
+        ready_id = stored_png((40, 40))
+        pending  = shop.StoredImage(data=b'', mime_type='image/png', status='pending')
+        shop.db.session.add(pending)
+        shop.db.session.commit()
+        pending_id = pending.id
+
+        shop.migrate_blobs('fs')
+        ready = shop.db.session.get(shop.StoredImage, ready_id)
+        data  = shop.blob_files().read(ready.storage_key)
+        assert ready.data == b'' and ready.storage_key.endswith(hashlib.sha256(data).hexdigest())
+        assert shop.db.session.get(shop.StoredImage, pending_id).storage_key is None
+
+        shop.migrate_blobs('db')
+        shop.db.session.expire_all()
+        ready = shop.db.session.get(shop.StoredImage, ready_id)
+        assert ready.storage_key is None and ready.data == data
+
+
+@pytest.mark.parametrize('storage, size', [('db', (60, 60)), ('fs', (61, 61))])
+def test_ranges(app, storage, size):
+    with app.app_context():
+        image_id = stored_png(size)
+        img      = shop.db.session.get(shop.StoredImage, image_id)
+        data     = img.data
+        if storage == 'fs':
+            img.storage_key, img.data = shop.blob_files().put(data), b''
+            shop.db.session.commit()
+    client = app.test_client()
+
+    resp = client.get(f'/img/{image_id}', headers={'Range': 'bytes=0-9'})
+    assert resp.status_code == 206 and resp.get_data() == data[:10]
+    resp = client.get(f'/img/{image_id}', headers={'Range': 'bytes=0-9,20-29'})
+    assert resp.status_code == 200 and resp.get_data() == data
+    resp = client.get(f'/img/{image_id}', headers={'Range': f'bytes={len(data) + 10}-'})
+    assert resp.status_code == 416
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+import app as shop
+
+
+def test_revenue_counts_orders_the_backfill_has_not_reached(app):
+    month = datetime.now().strftime('%m-%Y')
+    now   = datetime.now()
+    with app.app_context():
+        before = shop.compute_dashboard_kpis(month)
+        shop.db.session.add(shop.Design(design_code='KPI1', name='KPI test', description='',
+                                        price='150', price_amount=150, stock='In Stock'))
+        shop.db.session.add(shop.Design(design_code='KPI2', name='KPI legacy', description='',
+                                        price='1,000', stock='In Stock'))
+        shop.db.session.add_all([
+            shop.Order(design='KPI test', design_code='KPI1', phone='9100000001',
+                       status='Completed', quantity='1', qty=1, completed_ts=now,
+                       completed_at=now.strftime(shop.TIMESTAMP_FORMAT)),
+            # Not backfilled yet: only the legacy strings are set.
+            shop.Order(design='KPI test', design_code='KPI1', phone='9100000002',
+                       status='Completed', quantity='2',
+                       completed_at=now.strftime(shop.TIMESTAMP_FORMAT)),
+            shop.Order(design='KPI legacy', design_code='KPI2', phone='9100000003',
+                       status='Completed', quantity='1', qty=1, completed_ts=now,
+                       completed_at=now.strftime(shop.TIMESTAMP_FORMAT)),
+        ])
+        shop.db.session.commit()
+        after = shop.compute_dashboard_kpis(month)
+        assert shop.db.session.get(shop.CacheVersion, 'kpis') is not None
+    assert after['total_revenue'] - before['total_revenue'] == 150 + 300 + 1000
+    assert after['monthly_revenue'] - before['monthly_revenue'] == 150 + 300 + 1000
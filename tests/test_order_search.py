@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+import app as shop
+
+
+@pytest.fixture(scope='module')
+def orders(app):
+    rows = [dict(design='Lotus Kurti', design_code='SRCH1', customer_name=name, phone=phone,
+                 city=city, mandal='Central', pincode='500001', email='', size='M',
+                 quantity='1', qty=1, status='Pending', created_at='')
+            for name, phone, city in [('Ravi Teja', '9848012345', 'Hyderabad'),
+                                      ('Sita Devi', '9000055555', 'Warangal'),
+                                      ('Ravi Kumar', '9848099999', 'Guntur')]]
+    with app.app_context():
+        shop.db.session.execute(shop.db.insert(shop.Order), rows)
+        shop.db.session.commit()
+
+
+def test_every_postgres_predicate_uses_an_index():
+    sql, params = shop.search_sql('postgresql', ['ravi', 'ab', '984_8'], 'Pending')
+    where = sql.split(' WHERE ', 1)[1].split(' ORDER BY ', 1)[0]
+    preds = where.split(' AND ')
+    # Same expressions as the indexes built by ensure_order_search()
+    assert preds[0] == f"({shop.SEARCH_TEXT_SQL}) ILIKE :like0"
+    assert preds[1] == f"{shop.SEARCH_DOC_SQL} @@ to_tsquery('simple', :word1)"
+    assert preds[2] == f"({shop.SEARCH_TEXT_SQL}) ILIKE :like2"
+    assert preds[3].strip() == 'o.status = :status'
+    assert params['like0'] == '%ravi%' and params['word1'] == 'ab'
+    assert params['like2'] == '%984\\_8%'
+    # Trigram patterns of fewer than three characters cannot use the index.
+    for key, value in params.items():
+        if key.startswith('like'):
+            assert len(value.strip('%').replace('\\', '')) >= shop.SEARCH_MIN_PREFIX
+    assert ' OR ' not in where
+    assert params['tsq'] == 'ravi:* & ab & 984_8:*'
+    assert set(re.findall(r':(\w+)', sql)) <= set(params) | {'limit', 'offset'}
+
+
+def test_search_matches_every_word(admin, orders):
+    res = admin.get('/orders/search?q=ravi 98480').get_json()
+    assert {o['customer_name'] for o in res['results']} == {'Ravi Teja', 'Ravi Kumar'}
+    assert res['capped'] is False
+
+
+def test_short_query_is_refused(admin, orders):
+    resp = admin.get('/orders/search?q=ra')
+    assert resp.status_code == 400 and 'error' in resp.get_json()
+
+
+def test_capped_results_are_flagged(app, admin, orders, monkeypatch):
+    monkeypatch.setattr(shop, 'SEARCH_CANDIDATES', 2)
+    res = admin.get('/orders/search?q=lotus').get_json()
+    assert len(res['results']) == 2 and res['capped'] is True
+
+
+def test_missing_search_index_is_reported(app, admin, orders):
+    with app.app_context():
+        with shop.db.engine.begin() as conn:
+            conn.exec_driver_sql('DROP TABLE order_search')
+    try:
+        resp = admin.get('/orders/search?q=ravi')
+        assert resp.status_code == 503
+    finally:
+        with app.app_context():
+            for name in ('order_search_ai', 'order_search_ad', 'order_search_au'):
+                with shop.db.engine.begin() as conn:
+                    conn.exec_driver_sql(f'DROP TRIGGER IF EXISTS {name}')
+            shop.ensure_order_search()
@@ -0,0 +1,113 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import app as shop
+
+
+class FakeResend(BaseHTTPRequestHandler):
+    """Stands in for the Resend API. `respond(path, payload)` on the server
+    gives the status code; every request is kept in `server.requests`."""
+    protocol_version = 'HTTP/1.1'   # keep-alive, like the real API
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.requests.append((self.path, payload))
+        status = self.server.respond(self.path, payload)
+        body   = json.dumps({'data': []} if status < 300 else {'message': 'rejected'}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def resend(app):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeResend)
+    server.requests = []
+    server.respond  = lambda path, payload: 200
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with app.app_context():
+        shop.EmailOutbox.query.delete()
+        settings = shop.Settings.query.first()
+        settings.resend_api_key, settings.resend_from = 're_test', 'Shop <shop@example.com>'
+        shop.db.session.commit()
+        shop.refresh_settings()
+    yield server, shop.ResendTransport(f'http://127.0.0.1:{server.server_address[1]}/')
+    server.shutdown()
+    server.server_close()
+    with app.app_context():
+        shop.EmailOutbox.query.delete()
+        settings = shop.Settings.query.first()
+        settings.resend_api_key = settings.resend_from = ''
+        shop.db.session.commit()
+        shop.refresh_settings()
+
+
+def queue(*addresses):
+    shop.queue_emails([(to, f'Hello {to}', 'Body') for to in addresses])
+    shop.db.session.commit()
+
+
+def rows():
+    shop.db.session.expire_all()
+    return {r.to_addr: r for r in shop.EmailOutbox.query}
+
+
+def test_due_rows_go_out_in_one_batch(app, resend):
+    server, transport = resend
+    with app.app_context():
+        queue('a@example.com', 'b@example.com', 'c@example.com')
+        assert shop.drain_outbox(transport) == 3
+        assert {r.status for r in rows().values()} == {'sent'}
+    assert [path for path, _ in server.requests] == ['/emails/batch']
+    assert [m['to'] for m in server.requests[0][1]] == [['a@example.com'], ['b@example.com'],
+                                                        ['c@example.com']]
+    assert server.requests[0][1][0]['from'] == 'Shop <shop@example.com>'
+
+
+def test_rejected_batch_falls_back_to_single_sends(app, resend):
+    server, transport = resend
+    server.respond = lambda path, payload: (
+        422 if path == '/emails/batch' or payload['to'] == ['bad@example.com'] else 200)
+    with app.app_context():
+        queue('ok@example.com', 'bad@example.com')
+        shop.drain_outbox(transport)
+        got = rows()
+        assert got['ok@example.com'].status == 'sent'
+        assert got['bad@example.com'].status == 'dead'
+        assert 'HTTP 422' in got['bad@example.com'].last_error
+    assert [path for path, _ in server.requests] == ['/emails/batch', '/emails', '/emails']
+
+
+def test_failures_back_off_then_go_dead(app, resend):
+    server, transport = resend
+    server.respond = lambda path, payload: 503
+    with app.app_context():
+        queue('down@example.com')
+        delays = []
+        for attempt in range(1, shop.EMAIL_MAX_ATTEMPTS + 1):
+            started = datetime.utcnow()
+            assert shop.drain_outbox(transport) == 1
+            row = rows()['down@example.com']
+            assert row.attempts == attempt
+            if row.status == 'dead':
+                break
+            assert row.status == 'pending'
+            delays.append((row.next_attempt_at - started).total_seconds())
+            assert shop.drain_outbox(transport) == 0   # not due yet
+            row.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+            shop.db.session.commit()
+        assert row.status == 'dead' and row.attempts == shop.EMAIL_MAX_ATTEMPTS
+        assert 'HTTP 503' in row.last_error
+    for n, delay in enumerate(delays):
+        expected = min(shop.EMAIL_RETRY_MAX, shop.EMAIL_RETRY_BASE * 2 ** n)
+        assert expected * 0.8 - 1 <= delay <= expected * 1.2 + 1
+    assert len(server.requests) == shop.EMAIL_MAX_ATTEMPTS
@@ -0,0 +1,81 @@
+import pytest
+
+import app as shop
+
+SEED_ORDERS = 20000
+
+
+@pytest.fixture
+def seeded(app):
+    """A realistic order table (see seed_plan_orders), removed afterwards."""
+    with app.app_context():
+        shop.db.session.add(shop.Design(design_code='PLAN1', name='Plan check', description='',
+                                        price='100', price_amount=100, stock='In Stock',
+                                        stock_quantity=5))
+        shop.seed_plan_orders(SEED_ORDERS)
+        shop.db.session.commit()
+    yield app
+    with app.app_context():
+        shop.Order.query.filter_by(design='Plan check').delete()
+        shop.Design.query.filter_by(design_code='PLAN1').delete()
+        shop.db.session.commit()
+
+
+def capture_order_sql(app, calls):
+    """(statement, parameters) of every statement on the order table sent
+    while `calls` runs."""
+    seen = []
+
+    def hook(conn, cursor, statement, parameters, context, executemany):
+        if '"order"' in statement:
+            seen.append((statement, parameters))
+
+    with app.app_context():
+        engine = shop.db.engine
+    shop.db.event.listen(engine, 'before_cursor_execute', hook)
+    try:
+        calls()
+    finally:
+        shop.db.event.remove(engine, 'before_cursor_execute', hook)
+    return seen
+
+
+def test_route_queries_use_indexes(seeded, admin):
+    admin.get('/dashboard')   # KPIs: one aggregate pass per snapshot, not per request
+    phone = shop.PLAN_CHECK_PHONE
+
+    def calls():
+        admin.post('/track', data={'phone': phone})
+        admin.post('/order/PLAN1', data={'phone': phone})   # duplicate check, then no payment
+        admin.get('/dashboard')
+        admin.get('/dashboard?active_before=15000&completed_before=15000&cancelled_before=15000')
+        admin.get('/dashboard?format=json&section=active')
+        admin.get('/orders/search?q=plan+check')
+        admin.post('/clear_orders', data={'status': 'Cancelled', 'mode': 'selected',
+                                          'ids': ['10', '11']})
+        admin.post('/clear_orders', data={'status': 'Cancelled', 'mode': 'all'})
+
+    statements = capture_order_sql(seeded, calls)
+    assert len(statements) >= 10
+    with seeded.app_context():
+        conn  = shop.db.engine.raw_connection()
+        scans = []
+        for statement, parameters in statements:
+            plan = [row[-1] for row in conn.execute('EXPLAIN QUERY PLAN ' + statement, parameters)]
+            # order search joins the table as "o"
+            if shop.is_full_scan(plan) or shop.is_full_scan(plan, 'o'):
+                scans.append((' '.join(statement.split()).split(' FROM ')[-1][:300], plan))
+        conn.close()
+    assert not scans, scans
+
+
+def test_is_full_scan_reads_nested_and_index_scans():
+    assert shop.is_full_scan(['Limit  (cost=0.00..1.00 rows=1 width=8)',
+                              '  ->  Seq Scan on "order"  (cost=0.00..9.00 rows=9 width=8)'])
+    assert shop.is_full_scan(['Gather', '  ->  Parallel Seq Scan on "order"'])
+    assert shop.is_full_scan(['SCAN order USING INDEX ix_order_status_id'])
+    assert shop.is_full_scan(['SCAN order USING COVERING INDEX ix_order_status_id'])
+    assert shop.is_full_scan(['SCAN order'])
+    assert not shop.is_full_scan(['SEARCH order USING INDEX ix_order_status_id (status=?)'])
+    assert not shop.is_full_scan(['Limit', '  ->  Index Scan using ix_order_status_id on "order"'])
+    assert not shop.is_full_scan(['SCAN order_search VIRTUAL TABLE INDEX 192:M7'])
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+
+import pytest
+
+import app as shop
+
+
+def add_completed(name):
+    shop.db.session.add(shop.Order(design='Replica test', design_code='REP1', phone='9300000001',
+                                   customer_name=name, status='Completed', quantity='1', qty=1))
+    shop.db.session.commit()
+
+
+@pytest.fixture
+def replica_app(app):
+    """A second app on the same primary file, reading from a copy of it."""
+    primary = app.config['SQLALCHEMY_DATABASE_URI'].removeprefix('sqlite:///')
+    copy    = os.path.join(os.path.dirname(primary), 'replica.db')
+    with sqlite3.connect(primary) as src, sqlite3.connect(copy) as dst:
+        src.backup(dst)
+    replica = shop.create_app({
+        'SQLALCHEMY_DATABASE_URI': app.config['SQLALCHEMY_DATABASE_URI'],
+        'DATABASE_REPLICA_URL':    f'sqlite:///{copy}',
+        'UPLOAD_SPOOL_DIR':        app.config['UPLOAD_SPOOL_DIR'],
+        'BLOB_DIR':                app.config['BLOB_DIR'],
+        'WTF_CSRF_ENABLED':        False,
+        'TESTING':                 True,
+    })
+    with replica.app_context():
+        with shop.db.engines['replica'].begin() as conn:
+            conn.execute(shop.db.insert(shop.Order).values(
+                design='Replica test', design_code='REP1', phone='9300000001',
+                customer_name='Only on the replica', status='Completed', quantity='1', qty=1))
+        add_completed('Only on the primary')
+    yield replica
+    with replica.app_context():
+        for engine in shop.db.engines.values():
+            engine.dispose()
+    os.remove(copy)
+    with app.app_context():
+        shop.Order.query.filter_by(design_code='REP1').delete()
+        shop.db.session.commit()
+
+
+def test_reads_use_the_replica_until_an_admin_writes(replica_app):
+    client = replica_app.test_client()
+    with client.session_transaction() as s:
+        s['admin'] = True
+
+    def completed_names():
+        resp = client.get('/dashboard?format=json&section=completed')
+        return {o['customer_name'] for o in resp.get_json()['sections']['completed']['orders']}
+
+    assert 'Only on the replica' in completed_names()
+    assert 'Only on the primary' not in completed_names()
+    export = client.get('/export_orders?format=csv&status=Completed').get_data(as_text=True)
+    assert 'Only on the replica' in export and 'Only on the primary' not in export
+
+    with replica_app.app_context():
+        order_id = shop.Order.query.filter_by(customer_name='Only on the primary').one().id
+    client.post(f'/update_status/{order_id}', data={'status': 'Completed'})
+    assert 'Only on the primary' in completed_names()
+    assert 'Only on the replica' not in completed_names()
+    export = client.get('/export_orders?format=csv&status=Completed').get_data(as_text=True)
+    assert 'Only on the primary' in export
+
+    with client.session_transaction() as s:
+        s['primary_until'] = 0   # the sticky window has passed
+    assert 'Only on the replica' in completed_names()
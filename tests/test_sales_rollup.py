@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+import app as shop
+from test_checkout import order_form
+
+
+def buckets(design_code):
+    shop.db.session.expire_all()
+    return {(b.day, b.status): b.orders
+            for b in shop.SalesDaily.query.filter_by(design_code=design_code)}
+
+
+def test_checkout_and_status_changes_keep_buckets_consistent(app, admin, monkeypatch):
+    monkeypatch.setattr(shop, 'UPLOAD_WORKERS', 0)
+    today = datetime.now()
+    old   = today - timedelta(days=40)
+    with app.app_context():
+        shop.db.session.add(shop.Design(design_code='ROLL1', name='Rollup test', description='',
+                                        price='100', price_amount=100, stock='In Stock',
+                                        stock_quantity=5))
+        # Placed before the rollup started: never added to a bucket.
+        legacy = shop.Order(design='Rollup test', design_code='ROLL1', phone='9200000001',
+                            status='Shipped', quantity='1', qty=1, created_ts=old,
+                            created_at=old.strftime(shop.TIMESTAMP_FORMAT))
+        shop.db.session.add(legacy)
+        shop.db.session.commit()
+        legacy_id = legacy.id
+
+    resp = app.test_client().post('/order/ROLL1', data=order_form('9200000002', (1, 2, 3)),
+                                  content_type='multipart/form-data')
+    assert resp.status_code == 200
+    with app.app_context():
+        new_id = shop.Order.query.filter_by(phone='9200000002').one().id
+        assert buckets('ROLL1') == {(today.date(), 'Pending'): 1}
+
+    admin.post(f'/update_status/{legacy_id}', data={'status': 'Completed'})
+    admin.post(f'/update_status/{new_id}', data={'status': 'Shipped'})
+    with app.app_context():
+        assert buckets('ROLL1') == {(today.date(), 'Pending'): 0, (today.date(), 'Shipped'): 1}
@@ -0,0 +1,39 @@
+import time
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+import app as shop
+
+
+def png(colour):
+    buf = BytesIO()
+    Image.new('RGB', (40, 40), colour).save(buf, 'PNG')
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_add_design_processes_every_image(app, admin, monkeypatch, workers):
+    monkeypatch.setattr(shop, 'UPLOAD_WORKERS', workers)
+    code   = f'UP{workers}'
+    images = [(BytesIO(png((workers * 40, i * 60, 90))), f'{i}.png') for i in range(3)]
+    resp = admin.post('/add_design', content_type='multipart/form-data', data={
+        'code': code, 'name': 'Upload test', 'description': '', 'price': '100',
+        'stock_quantity': '5', 'images': images})
+    assert resp.status_code == 302
+
+    with app.app_context():
+        design = shop.Design.query.filter_by(design_code=code).one()
+        ids    = [shop.image_id_from_url(i.filename) for i in design.images]
+        assert len(set(ids)) == 3
+        deadline = time.monotonic() + 10
+        while True:
+            statuses = [shop.db.session.get(shop.StoredImage, i).status for i in ids]
+            if statuses == [None] * 3 or time.monotonic() > deadline:
+                break
+            shop.db.session.rollback()
+            time.sleep(0.05)
+        assert statuses == [None] * 3
+        photo = design.image
+    assert admin.get(photo).status_code == 200